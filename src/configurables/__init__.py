@@ -44,7 +44,14 @@ This order can be customized using the resolution operators:
 ... def my_function(...):
 ...     pass
 """
-from configurables.configurable import configurable, configure, option, param
+from configurables.configurable import (
+    configurable,
+    configure,
+    configure_string,
+    option,
+    param,
+    params,
+)
 from configurables.parse import CFG, CLI, ENV
 from configurables._version import __version__
 
@@ -54,7 +61,9 @@ __email__ = "willfong@mit.edu"
 
 __all__ = [
     "configure",
+    "configure_string",
     "param",
+    "params",
     "option",
     "configurable",
     "ENV",
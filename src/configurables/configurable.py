@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import io
 import os
-import pathlib
 import typing
-from typing import Any, Callable, Optional, TypeVar, Union
+from typing import Any, Callable, Mapping, Optional, TypeVar, Union
 
 from configurables.core import (
     ConfigurationBuilder,
@@ -14,7 +14,6 @@ from configurables.parse import (
     CFG,
     CLI,
     ENV,
-    PARSING_REGISTRY,
     ResolutionDefinition,
     autoparse_config,
 )
@@ -25,7 +24,7 @@ T = TypeVar("T")
 
 def configure(
     target: typing.Callable,
-    config_path: typing.Union[str, os.PathLike],
+    config_path: typing.Union[str, os.PathLike, typing.TextIO],
     config_group: typing.Optional[str] = None,
     extension_override: typing.Optional[str] = None,
 ) -> typing.Callable:
@@ -40,8 +39,9 @@ def configure(
     ----------
     target : callable
         A callable to pass keyword arguments to.
-    config_path : str or PathLike
-        A path to a configuration file.
+    config_path : str, PathLike or text stream
+        A path to a configuration file, or an open text stream of one.
+        Streams are parsed as INI unless ``extension_override`` is given.
     config_group : str, optional
         The path to resolving to a desired group within the
         configuration object.
@@ -59,18 +59,77 @@ def configure(
     >>> def process(name, value):
     ...     return f"{name}: {value}"
     >>> result = configure(process, "config.ini", "Settings")
+    >>> # Configuration held in memory
+    >>> text = "[Settings]\\nname = a\\nvalue = 1\\n"
+    >>> result = configure(process, io.StringIO(text), "Settings")
     """
-    path = pathlib.Path(config_path)
-
-    if extension_override is not None:
-        lookup = PARSING_REGISTRY[extension_override]
-        config = lookup(path, config_group)
-    else:
-        config = autoparse_config(path, config_group)
+    config = autoparse_config(
+        config_path, config_group, extension=extension_override
+    )
 
     return target(**config)
 
 
+def configure_string(
+    target: typing.Callable,
+    text: str,
+    config_group: typing.Optional[str] = None,
+    extension_override: str = ".ini",
+) -> typing.Callable:
+    """
+    Configure a callable from configuration text held in memory.
+
+    Behaves like ``configure`` without touching the filesystem.
+
+    Parameters
+    ----------
+    target : callable
+        A callable to pass keyword arguments to.
+    text : str
+        The contents of a configuration file.
+    config_group : str, optional
+        The path to resolving to a desired group within the
+        configuration object.
+    extension_override : str, optional
+        The extension whose parser should read ``text``. Default is
+        ".ini".
+
+    Returns
+    -------
+    Any
+        The result of calling target with the configuration as keyword
+        arguments.
+
+    Examples
+    --------
+    >>> def process(name, value):
+    ...     return f"{name}: {value}"
+    >>> text = "[Settings]\\nname = a\\nvalue = 1\\n"
+    >>> configure_string(process, text, "Settings")
+    'a: 1'
+    """
+    return configure(
+        target,
+        io.StringIO(text),
+        config_group,
+        extension_override=extension_override,
+    )
+
+
+def _ensure_builder(
+    obj: Union[ConfigurationBuilder[T], Callable[..., T]]
+) -> ConfigurationBuilder[T]:
+    """
+    Return ``obj`` if it is already a builder, otherwise wrap it in one.
+    """
+    if isinstance(obj, ConfigurationBuilder):
+        return obj
+    # Assume that we're decorating the target callable. The builder is
+    # constructed unsubscripted; ``ConfigurationBuilder[T]`` would build a
+    # generic alias at runtime on every decoration for no effect.
+    return ConfigurationBuilder(parameters={}, options={}, function=obj)
+
+
 def param(name: str, type: Callable = str) -> Callable[[Union[ConfigurationBuilder[T], Callable[..., T]]], ConfigurationBuilder[T]]:
     """
     A decorator to add a required parameter to a ConfigurationBuilder.
@@ -104,19 +163,57 @@ def param(name: str, type: Callable = str) -> Callable[[Union[ConfigurationBuild
     def _internal(
         obj: Union[ConfigurationBuilder[T], Callable[..., T]]
     ) -> ConfigurationBuilder[T]:
-        if isinstance(obj, ConfigurationBuilder):
-            config_builder = obj
-        else:
-            # Assume that we're decorating the target callable
-            config_builder = ConfigurationBuilder[T](
-                parameters={}, options={}, function=obj
-            )
+        config_builder = _ensure_builder(obj)
         config_builder.add_parameter(name=name, type=type)
         return config_builder
 
     return _internal
 
 
+def params(
+    types: Mapping[str, Callable]
+) -> Callable[
+    [Union[ConfigurationBuilder[T], Callable[..., T]]],
+    ConfigurationBuilder[T],
+]:
+    """
+    A decorator to add several required parameters at once.
+
+    Equivalent to stacking one ``param`` decorator per entry, but the
+    schema is extended in a single step.
+
+    Parameters
+    ----------
+    types : mapping of str to callable
+        The parameter names mapped to the types to cast them to.
+
+    Returns
+    -------
+    callable
+        A decorator function that adds the parameters to the configuration.
+
+    Examples
+    --------
+    >>> @configurable("Credentials")
+    ... @params({"username": str, "password": str})
+    ... def login(username, password):
+    ...     print(username, "*" * len(password))
+    ...
+    >>> login("credentials.ini")
+    someusername **********
+    """
+
+    def _internal(
+        obj: Union[ConfigurationBuilder[T], Callable[..., T]]
+    ) -> ConfigurationBuilder[T]:
+        config_builder = _ensure_builder(obj)
+        for name, type in types.items():
+            config_builder.add_parameter(name=name, type=type)
+        return config_builder
+
+    return _internal
+
+
 def option(
     name: str, type: Callable = str, default: Any = None
 ) -> Callable[[Union[ConfigurationBuilder[T], Callable[..., T]]], ConfigurationBuilder[T]]:
@@ -158,13 +255,7 @@ def option(
     def _internal(
         obj: Union[ConfigurationBuilder[T], Callable[..., T]]
     ) -> ConfigurationBuilder[T]:
-        if isinstance(obj, ConfigurationBuilder):
-            config_builder = obj
-        else:
-            # Assume that we're decorating the target callable
-            config_builder = ConfigurationBuilder[T](
-                parameters={}, options={}, function=obj
-            )
+        config_builder = _ensure_builder(obj)
         config_builder.add_option(name=name, type=type, default=default)
         return config_builder
 
@@ -174,6 +265,7 @@ def option(
 def configurable(
     config_section: Optional[str] = None,
     order: Optional[ResolutionDefinition] = None,
+    cache_casts: bool = False,
 ) -> Callable[[ConfigurationBuilder[T]], ConfigurationFactory[T]]:
     """
     The top-level decorator to fully bind a callable.
@@ -187,6 +279,11 @@ def configurable(
     order : ResolutionDefinition, optional
         Custom resolution order for configuration sources. If not provided,
         the default order is CLI > CFG > ENV.
+    cache_casts : bool, optional
+        Memoize the results of custom ``type`` conversions per raw value
+        so they are not re-run on every call. Only enable this when every
+        conversion is a pure function of its input; results that are not
+        known to be immutable are never shared. Default is False.
         
     Returns
     -------
@@ -226,7 +323,8 @@ def configurable(
         factory = ConfigurationFactory[T](
             config_builder,
             config_section or "DEFAULT",
-            default_order if order is None else order
+            default_order if order is None else order,
+            cache_casts=cache_casts,
         )
         # Return the factory with enhanced typing
         return create_typed_wrapper(factory)
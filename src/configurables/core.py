@@ -1,29 +1,48 @@
 from __future__ import annotations
 
 import pathlib
-from dataclasses import dataclass
+import sys
+from collections import OrderedDict
 from functools import partial
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    Mapping,
+    NamedTuple,
     Optional,
     TypeVar,
     Union,
     overload,
 )
 
-from configurables.emission import autoemit_config
-from configurables.parse import ResolutionDefinition
+from configurables.parse import ResolutionDefinition, _as_path
 
 # Type variables for generic support
 T = TypeVar("T")  # Return type of the wrapped function
 # When Python 3.10+ ParamSpec is available, we can use it for better parameter typing
 
+# Casts implemented in C are cheaper to re-apply than to look up
+_BUILTIN_CASTS = (str, int, float, bool)
+# Only immutable results may be shared between calls through the cast cache.
+# Containers are left out since their elements may still be mutable.
+_IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    type(None),
+    pathlib.PurePath,
+)
+_CAST_CACHE_SIZE = 256
+
+# Sentinel for absent keys, distinct from a legitimate None value
+_MISSING = object()
+
 
-@dataclass
-class Parameter:
+class Parameter(NamedTuple):
     """
     Represents a required configuration parameter.
 
@@ -49,8 +68,7 @@ class Parameter:
     type: Callable
 
 
-@dataclass
-class Option:
+class Option(NamedTuple):
     """
     Represents an optional configuration parameter with a default value.
 
@@ -80,7 +98,6 @@ class Option:
     default: Any
 
 
-@dataclass
 class ConfigurationBuilder(Generic[T]):
     """
     Builds configuration schema for a function.
@@ -97,9 +114,18 @@ class ConfigurationBuilder(Generic[T]):
     function : callable
         The function that will be configured.
     """
-    parameters: Dict[str, Parameter]
-    options: Dict[str, Option]
-    function: Callable[..., T]
+
+    __slots__ = ("parameters", "options", "function")
+
+    def __init__(
+        self,
+        parameters: Dict[str, Parameter],
+        options: Dict[str, Option],
+        function: Callable[..., T],
+    ):
+        self.parameters = parameters
+        self.options = options
+        self.function = function
 
     def add_parameter(self, name: str, type: Callable) -> Parameter:
         """
@@ -117,6 +143,8 @@ class ConfigurationBuilder(Generic[T]):
         Parameter
             The created Parameter object.
         """
+        # Interned names let dict probes on every call compare by identity
+        name = sys.intern(name)
         parameter = Parameter(name=name, type=type)
         self.parameters[name] = parameter
 
@@ -145,6 +173,7 @@ class ConfigurationBuilder(Generic[T]):
         Option
             The created Option object.
         """
+        name = sys.intern(name)
         option = Option(name=name, type=type, default=default)
         self.options[name] = option
 
@@ -167,6 +196,8 @@ class ConfigurationFactory(Generic[T]):
         Default configuration file section to use.
     configuration_order : ResolutionDefinition
         Defines the precedence order for configuration sources.
+    cache_casts : bool
+        Whether results of user supplied type conversions are memoized.
 
     Examples
     --------
@@ -184,6 +215,7 @@ class ConfigurationFactory(Generic[T]):
         config_builder: ConfigurationBuilder[T],
         section: str,
         configuration_order: ResolutionDefinition,
+        cache_casts: bool = False,
     ):
         """
         Initialize a ConfigurationFactory.
@@ -196,63 +228,80 @@ class ConfigurationFactory(Generic[T]):
             Default configuration section name.
         configuration_order : ResolutionDefinition
             Resolution order for configuration sources.
+        cache_casts : bool, optional
+            Memoize the results of user supplied type conversions. Only
+            enable this for conversions that are pure functions of the raw
+            value. Default is False.
         """
         self.builder = config_builder
         self.section = section
         self.configuration_order = configuration_order
+        self.cache_casts = cache_casts
+        self._cast_cache: OrderedDict[tuple, Any] = OrderedDict()
+        self._resolve = _compile_resolver(
+            config_builder, self._cast if cache_casts else None
+        )
+        self._parameter_keys = frozenset(config_builder.parameters)
+        self._keys = self._parameter_keys.union(config_builder.options)
 
     def __repr__(self) -> str:
         function = self.builder.function
         return repr(function)
 
-    def _resolve_param(self, key: str, raw_values: dict) -> Any:
+    def _cast(self, key: str, _type: Callable, raw_value: Any) -> Any:
         """
-        Resolve a parameter value with type conversion.
+        Apply a type conversion, memoizing the result where it is safe.
 
-        Parameters
-        ----------
-        key : str
-            Parameter name.
-        raw_values : dict
-            Raw configuration values.
-
-        Returns
-        -------
-        Any
-            Type-converted parameter value.
-
-        Raises
-        ------
-        KeyError
-            If the required parameter is not found.
-        """
-        _type = self.builder.parameters[key].type
-        value = raw_values[key]
-        return _type(value)
-
-    def _resolve_option(self, key: str, raw_values: dict) -> Any:
-        """
-        Resolve an option value with type conversion or default.
+        Used when the factory was created with ``cache_casts=True``.
+        Results of user supplied conversions are cached per
+        ``(key, raw_value)`` in a bounded LRU so expensive conversions are
+        not repeated when the same configuration is loaded again. Builtin
+        conversions, unhashable raw values, and results that are not known
+        to be immutable bypass the cache.
 
         Parameters
         ----------
         key : str
-            Option name.
-        raw_values : dict
-            Raw configuration values.
+            Parameter or option name.
+        _type : callable
+            Type conversion function.
+        raw_value : Any
+            Raw configuration value.
 
         Returns
         -------
         Any
-            Type-converted option value or default if not found.
+            Type-converted value.
         """
-        _type = self.builder.options[key].type
+        if _type in _BUILTIN_CASTS:
+            return _type(raw_value)
+
+        cache = self._cast_cache
+        cache_key = (key, type(raw_value), raw_value)
         try:
-            raw_value = raw_values[key]
+            value = cache[cache_key]
+        except TypeError:
+            # Unhashable raw value, such as a repeated command line flag
+            return _type(raw_value)
         except KeyError:
-            return self.builder.options[key].default
+            value = _type(raw_value)
+            if isinstance(value, _IMMUTABLE_TYPES):
+                cache[cache_key] = value
+                if len(cache) > _CAST_CACHE_SIZE:
+                    try:
+                        cache.popitem(last=False)
+                    except KeyError:
+                        # Another thread emptied the cache meanwhile
+                        pass
+            return value
 
-        return _type(raw_value)
+        try:
+            cache.move_to_end(cache_key)
+        except KeyError:
+            # Evicted by another thread sharing this factory; the value
+            # read above is still valid
+            pass
+        return value
 
     @overload
     def __call__(
@@ -309,8 +358,11 @@ class ConfigurationFactory(Generic[T]):
         >>> # Override section and values
         >>> result = configured_func("config.ini", _section="Dev", timeout=60)
         """
+        if overrides.keys() >= self._keys:
+            # Fully specified calls go straight to the function
+            return self.builder.function(**overrides)
         if _filepath is not None:
-            _filepath = pathlib.Path(_filepath)
+            _filepath = _as_path(_filepath)
         kwargs = self.parse(_section, _filepath=_filepath, **overrides)
         return self.builder.function(**kwargs)
 
@@ -326,7 +378,8 @@ class ConfigurationFactory(Generic[T]):
 
         Given the schema configuration, parse any provided overrides, and load
         configurations from the relevant configuration file, environment
-        variables, or command line definitions.
+        variables, or command line definitions. If the overrides already
+        provide every key in the schema, no configuration source is loaded.
 
         Parameters
         ----------
@@ -348,24 +401,22 @@ class ConfigurationFactory(Generic[T]):
             Dictionary of resolved configuration values ready to pass to the
             wrapped function.
         """
+        required = self._parameter_keys if _ignore_options else self._keys
+        if overrides.keys() >= required:
+            # Every value is supplied directly, no source needs loading
+            return dict(overrides)
+
         context: Dict[str, Any] = {}
         if _filepath is not None:
             context["config_path"] = _filepath
         if section is None:
             section = self.section
         context["parse_kwargs"] = {"section": section}
-        kwargs = {}
+        context["schema_keys"] = self._keys
         parsed_opts = self.configuration_order.load(**context)
-        for parameter in self.builder.parameters.keys():
-            try:
-                kwargs[parameter] = self._resolve_param(parameter, parsed_opts)
-            except KeyError:
-                kwargs[parameter] = overrides[parameter]
-
-        if not _ignore_options:
-            for option in self.builder.options.keys():
-                kwargs[option] = self._resolve_option(option, parsed_opts)
-        kwargs.update(overrides)
+        kwargs = self._resolve(parsed_opts, overrides, _ignore_options)
+        if overrides:
+            kwargs.update(overrides)
         return kwargs
 
     def emit(
@@ -410,6 +461,9 @@ class ConfigurationFactory(Generic[T]):
             _ignore_options=_ignore_options,
             **overrides,
         )
+        # Emission is rarely used, so its module loads on first call
+        from configurables.emission import autoemit_config
+
         section = self.section if _section is None else _section
         return autoemit_config(output_path, kwargs, section=section)
 
@@ -448,6 +502,71 @@ class ConfigurationFactory(Generic[T]):
         return partial(self.builder.function, **kwargs)
 
 
+def _compile_resolver(
+    config_builder: ConfigurationBuilder[T],
+    cast: Optional[Callable[[str, Callable, Any], Any]] = None,
+) -> Callable[[Mapping[str, Any], Mapping[str, Any], bool], Dict[str, Any]]:
+    """
+    Build the per-factory function that applies the schema to raw values.
+
+    The schema is fixed once the decorators have been applied, so the
+    parameter and option definitions are flattened into a single tuple
+    captured by a closure. Resolving a configuration then walks that tuple
+    once instead of re-indexing the builder for every key on every call.
+
+    Parameters
+    ----------
+    config_builder : ConfigurationBuilder
+        The completed configuration schema.
+    cast : callable, optional
+        Called as ``cast(name, type, raw_value)`` to convert raw values.
+        If None, the schema type is applied to the raw value directly.
+
+    Returns
+    -------
+    callable
+        ``resolve(parsed_opts, overrides, ignore_options)`` returning the
+        resolved keyword arguments for every key not present in
+        ``overrides``; the caller merges the overrides afterwards.
+    """
+    # Parameters and options share one flattened schema of
+    # (name, type, is_option, default) so a single loop resolves both.
+    parameters = tuple(
+        (name, parameter.type, False, None)
+        for name, parameter in config_builder.parameters.items()
+    )
+    schema = parameters + tuple(
+        (name, option.type, True, option.default)
+        for name, option in config_builder.options.items()
+    )
+
+    def resolve(
+        parsed_opts: Mapping[str, Any],
+        overrides: Mapping[str, Any],
+        ignore_options: bool,
+    ) -> Dict[str, Any]:
+        kwargs = {}
+        lookup = parsed_opts.get
+        for name, _type, is_option, default in (
+            parameters if ignore_options else schema
+        ):
+            if name in overrides:
+                # Merged by the caller, so converting the source is wasted
+                continue
+            raw_value = lookup(name, _MISSING)
+            if raw_value is _MISSING:
+                if not is_option:
+                    raise KeyError(name)
+                kwargs[name] = default
+            elif cast is None:
+                kwargs[name] = _type(raw_value)
+            else:
+                kwargs[name] = cast(name, _type, raw_value)
+        return kwargs
+
+    return resolve
+
+
 def create_typed_wrapper(factory: ConfigurationFactory[T]) -> ConfigurationFactory[T]:
     """
     Create a typed wrapper for a ConfigurationFactory that preserves type information.
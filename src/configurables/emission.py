@@ -31,7 +31,7 @@ Examples
 """
 from __future__ import annotations
 
-import configparser
+import os
 import pathlib
 import typing
 
@@ -47,7 +47,7 @@ EMISSION_REGISTRY: dict[
 
 
 def autoemit_config(
-    path: pathlib.Path,
+    path: typing.Union[str, os.PathLike],
     configuration: dict[typing.Any, typing.Any],
     section: typing.Optional[str] = None,
 ) -> pathlib.Path:
@@ -59,7 +59,7 @@ def autoemit_config(
     
     Parameters
     ----------
-    path : pathlib.Path
+    path : str or PathLike
         Output path for the configuration file. The file extension
         determines which emitter to use.
     configuration : dict
@@ -83,17 +83,21 @@ def autoemit_config(
     >>> autoemit_config(Path("db.ini"), config, "Database")
     PosixPath('/home/user/db.ini')
     """
+    if isinstance(path, pathlib.Path):
+        output_path = path
+    else:
+        output_path = pathlib.Path(path)
     try:
-        func = EMISSION_REGISTRY[path.suffix]
+        func = EMISSION_REGISTRY[output_path.suffix]
     except KeyError:
         supported_extensions = ", ".join(EMISSION_REGISTRY.keys())
         raise KeyError(
-            f"Unsupported file extension '{path.suffix}'. "
+            f"Unsupported file extension '{output_path.suffix}'. "
             f"Supported extensions are: {supported_extensions}"
         )
     if section is None:
         section = "DEFAULT"
-    return func(path, section, configuration)
+    return func(output_path, section, configuration)
 
 
 def register(
@@ -178,6 +182,8 @@ def emit_init(
     >>> # port = 5432
     >>> # debug = true
     """
+    import configparser
+
     parser = configparser.ConfigParser()
     parser[header] = configuration
 
@@ -9,7 +9,7 @@ The module implements:
 - A flexible precedence system using overloaded operators (>, <)
 - Pluggable interpreters for different configuration sources
 - A registry system for configuration file parsers
-- Default parsers for INI/CONF file formats
+- Default parsers for INI/CONF and JSON file formats
 
 Classes
 -------
@@ -34,6 +34,8 @@ register
     Decorator to register file format parsers.
 parse_ini
     Parse INI/CONF configuration files.
+parse_json
+    Parse JSON configuration files.
 
 Examples
 --------
@@ -54,37 +56,33 @@ Examples
 
 from __future__ import annotations
 
-import configparser
+import copy
+import functools
+import importlib.util
 import operator
 import os
 import pathlib
 import sys
+import types
 import typing
 
-# Optional dependencies for YAML and TOML support
-try:
-    import yaml  # type: ignore[import-untyped]
-
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+if typing.TYPE_CHECKING:
+    import configparser
 
-try:
-    # Python 3.11+ has tomllib in standard library
-    import tomllib
-
-    HAS_TOML = True
-except ImportError:
-    try:
-        # For older Python versions, try tomli
-        import tomli as tomllib  # type: ignore[import-not-found]
-
-        HAS_TOML = True
-    except ImportError:
-        HAS_TOML = False
+# Optional dependencies for YAML and TOML support. Only their availability
+# is probed here; the modules are imported by their parser on first use so
+# that ``import configurables`` does not pay for unused backends.
+HAS_YAML = importlib.util.find_spec("yaml") is not None
+HAS_TOML = (
+    importlib.util.find_spec("tomllib") is not None
+    or importlib.util.find_spec("tomli") is not None
+)
 
 PARSING_REGISTRY = {}  # type: typing.Dict[str, typing.Any]
 
+# A configuration file, given either by path or as an open text stream
+SOURCE = typing.Union[str, os.PathLike, typing.TextIO]
+
 RHS = typing.Union["ResolutionDefinition", "Interpreter"]
 LHS = RHS
 OP = typing.Callable[[LHS, RHS], "ResolutionDefinition"]
@@ -156,6 +154,8 @@ class ResolutionDefinition:
             The initial Interpreter or ResolutionDefinition in the chain.
         """
         self.interpreter_order = [first_element]
+        # Mirrors interpreter_order for constant time duplicate checks
+        self._members = {first_element}
 
     def __lt__(self, rhs: "RHS") -> "ResolutionDefinition":
         """
@@ -176,9 +176,10 @@ class ResolutionDefinition:
         InvalidOrdering
             If rhs is already in the ordering chain.
         """
-        if rhs in self.interpreter_order:
+        if rhs in self._members:
             raise InvalidOrdering()
 
+        self._members.add(rhs)
         self.interpreter_order.insert(0, rhs)
         return self
 
@@ -201,18 +202,20 @@ class ResolutionDefinition:
         InvalidOrdering
             If rhs is already in the ordering chain.
         """
-        if rhs in self.interpreter_order:
+        if rhs in self._members:
             raise InvalidOrdering()
 
+        self._members.add(rhs)
         self.interpreter_order.append(rhs)
         return self
 
-    def load(self, **context: typing.Any) -> dict:
+    def load(self, **context: typing.Any) -> typing.Mapping[str, typing.Any]:
         """
         Load configuration from all sources in precedence order.
 
         Values from higher precedence sources override those from lower
-        precedence sources.
+        precedence sources. A single source is returned as-is without
+        merging.
 
         Parameters
         ----------
@@ -220,13 +223,17 @@ class ResolutionDefinition:
             Context information passed to interpreters, such as:
             - config_path: Path to configuration file
             - parse_kwargs: Additional parsing arguments
+            - schema_keys: Names the caller will look up
 
         Returns
         -------
-        dict
+        Mapping
             Merged configuration with precedence rules applied.
         """
-        payload = {}
+        if len(self.interpreter_order) == 1:
+            return self.interpreter_order[0].load(**context)
+
+        payload: typing.Dict[str, typing.Any] = {}
 
         for interpreter in self.interpreter_order:
             kwargs = interpreter.load(**context)
@@ -236,36 +243,202 @@ class ResolutionDefinition:
 
 
 def autoparse_config(
-    path: pathlib.Path, section: typing.Optional[str] = None
-) -> dict:
+    path: SOURCE,
+    section: typing.Optional[str] = None,
+    extension: typing.Optional[str] = None,
+) -> typing.Dict[str, typing.Any]:
     """
     Automatically parse a configuration file based on its extension.
 
     This function looks up the appropriate parser in the PARSING_REGISTRY
     based on the file extension and uses it to parse the configuration.
+    Parsed results are cached by path and stat signature (device, inode,
+    size, modification and change times) so repeated loads of an
+    unchanged file skip the disk read and parse.
 
     Parameters
     ----------
-    path : pathlib.Path
-        Path to the configuration file.
+    path : str, PathLike or text stream
+        Path to the configuration file, or an open text stream such as
+        ``io.StringIO``. Streams are read and parsed on every call and
+        are parsed as INI unless ``extension`` says otherwise.
     section : str, optional
         Section within the configuration file to parse. If None, the
         default section is used.
+    extension : str, optional
+        Parse the file as if it had this extension instead of sniffing
+        the path suffix. The extension must be registered.
 
     Returns
     -------
     dict
-        Parsed configuration as key-value pairs.
+        Parsed configuration as key-value pairs. Each call returns a new
+        dict that the caller is free to modify.
+
+    Raises
+    ------
+    KeyError
+        If ``extension`` is provided but no parser is registered for it.
 
     Notes
     -----
     Falls back to .ini parser if the file extension is not registered.
+    The result and any nested values such as lists and tables are copied
+    on every call, so mutating them never leaks into later loads.
+    A file rewritten in place with the same size within the filesystem's
+    timestamp granularity keeps its stat signature and may be served
+    from the cache; call ``autoparse_config.cache_clear()`` after such
+    writes.
+    The parser is part of the cache key, so registering a new parser for
+    an extension takes effect on the next call.
+    """
+    if hasattr(path, "read"):
+        # Streams have no stat signature to cache on
+        stream = typing.cast(typing.TextIO, path)
+        parser = PARSING_REGISTRY[".ini" if extension is None else extension]
+        if section is None:
+            result = parser(stream)
+        else:
+            result = parser(stream, section)
+        return dict(result)
+
+    config_path = _as_path(
+        typing.cast(typing.Union[str, os.PathLike], path)
+    ).expanduser()
+    if extension is None:
+        parser = PARSING_REGISTRY.get(config_path.suffix)
+        if parser is None:
+            parser = PARSING_REGISTRY[".ini"]
+    else:
+        parser = PARSING_REGISTRY[extension]
+    stat = os.stat(config_path)
+    # Device and inode tell apart files reached through the same relative
+    # path from different working directories; ctime catches rewrites
+    # that restore the previous mtime.
+    signature = (
+        stat.st_dev,
+        stat.st_ino,
+        stat.st_size,
+        stat.st_mtime_ns,
+        stat.st_ctime_ns,
+    )
+    cached, nested = _cached_parse(config_path, signature, section, parser)
+    # Callers may mutate what they were handed; give each one its own
+    # copy so the cached parse stays pristine.
+    fresh = dict(cached)
+    for key in nested:
+        fresh[key] = copy.deepcopy(fresh[key])
+    return fresh
+
+
+def _as_path(path: typing.Union[str, os.PathLike]) -> pathlib.Path:
+    """
+    Convert ``path`` to a ``pathlib.Path``, reusing existing instances.
+
+    String paths are converted through a small cache since callers tend
+    to pass the same literal on every call.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Path to convert.
+
+    Returns
+    -------
+    pathlib.Path
+        ``path`` itself if it is already a ``Path``, otherwise a new or
+        cached ``Path`` instance.
+    """
+    if isinstance(path, pathlib.Path):
+        return path
+    if isinstance(path, str):
+        return _path_from_str(path)
+    return pathlib.Path(path)
+
+
+@functools.lru_cache(maxsize=128)
+def _path_from_str(path: str) -> pathlib.Path:
+    """
+    Convert a string to a ``pathlib.Path``, cached on the string.
+
+    Parameters
+    ----------
+    path : str
+        Path to convert.
+
+    Returns
+    -------
+    pathlib.Path
+        A ``Path`` shared by every call with the same string.
+    """
+    return pathlib.Path(path)
+
+
+def _read_source(source: SOURCE) -> typing.Tuple[str, str]:
+    """
+    Read the full text of a configuration source.
+
+    Returns
+    -------
+    tuple of (str, str)
+        The text and a name describing where it came from, for use in
+        error messages.
+    """
+    if hasattr(source, "read"):
+        stream = typing.cast(typing.TextIO, source)
+        return stream.read(), str(getattr(stream, "name", "<stream>"))
+    config_path = _as_path(
+        typing.cast(typing.Union[str, os.PathLike], source)
+    ).expanduser()
+    return config_path.read_text(), str(config_path)
+
+
+# Values of these types can be shared between callers without copying
+_IMMUTABLE_VALUE_TYPES = frozenset((str, int, float, bool, type(None), bytes))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_parse(
+    path: pathlib.Path,
+    signature: typing.Tuple[int, ...],
+    section: typing.Optional[str],
+    parser: typing.Callable,
+) -> typing.Tuple[typing.Mapping[str, typing.Any], typing.FrozenSet[str]]:
+    """
+    Parse a configuration file, memoized on its stat signature.
+
+    ``signature`` is not used directly; it is part of the cache key so
+    that edits to the file, or a different file at the same path,
+    invalidate stale entries.
+
+    Returns the parsed section along with the keys whose values are not
+    known to be immutable and must be copied before handing them out.
     """
-    path = pathlib.Path(path).expanduser()
-    func = PARSING_REGISTRY.get(path.suffix, PARSING_REGISTRY[".ini"])
     if section is None:
-        return func(path)
-    return func(path, section)
+        result = parser(path)
+    else:
+        result = parser(path, section)
+    # Interned keys let lookups by the (interned) schema names match on
+    # identity; this runs once per file revision.
+    parsed = {
+        sys.intern(key) if type(key) is str else key: value
+        for key, value in result.items()
+    }
+    nested = frozenset(
+        key
+        for key, value in parsed.items()
+        if type(value) not in _IMMUTABLE_VALUE_TYPES
+    )
+    return types.MappingProxyType(parsed), nested
+
+
+# Expose cache management in the same style as functools.lru_cache
+autoparse_config.cache_clear = (  # type: ignore[attr-defined]
+    _cached_parse.cache_clear
+)
+autoparse_config.cache_info = (  # type: ignore[attr-defined]
+    _cached_parse.cache_info
+)
 
 
 def register(
@@ -274,6 +447,10 @@ def register(
     """
     Decorator to register a parser function for file extensions.
 
+    Parsers receive a path, or the open text stream when
+    ``autoparse_config`` is given one; only parsers that accept both can
+    be used with streams.
+
     Parameters
     ----------
     *extensions : str
@@ -302,16 +479,14 @@ def register(
 
 
 @register(".ini", ".conf")
-def parse_ini(
-    config_path: pathlib.Path, key: str
-) -> configparser.SectionProxy:
+def parse_ini(config_path: SOURCE, key: str) -> configparser.SectionProxy:
     """
     Parse an INI configuration file.
 
     Parameters
     ----------
-    config_path : pathlib.Path
-        Path to the INI configuration file.
+    config_path : str, PathLike or text stream
+        Path to the INI configuration file, or an open stream of it.
     key : str
         Section name within the INI file to parse.
 
@@ -334,17 +509,18 @@ def parse_ini(
     >>> host = config["host"]
     >>> port = int(config["port"])
     """
+    import configparser
+
     config = configparser.ConfigParser()
-    expanded = config_path.expanduser()
-    config.read(expanded)
-    established_keys = config.sections()
-    if key not in established_keys:
+    # Read once; the same text backs both parsing and the error report
+    content, source = _read_source(config_path)
+    config.read_string(content, source=source)
+    if not config.has_section(key):
         established_keys = config.sections()
-        content = open(expanded, "rt").read()
         raise KeyError(
             f"Could not find section '{key}', "
             f"only found [{', '.join(established_keys)}]."
-            f"Config File: {config_path}\n"
+            f"Config File: {source}\n"
             "---POTENTIALLY PRINTED SECRETS---\n"
             "Please review before copy-paste!\n"
             f"{content}"
@@ -354,14 +530,14 @@ def parse_ini(
 
 
 @register(".yaml", ".yml")
-def parse_yaml(config_path: pathlib.Path, key: str) -> dict:
+def parse_yaml(config_path: SOURCE, key: str) -> dict:
     """
     Parse a YAML configuration file.
 
     Parameters
     ----------
-    config_path : pathlib.Path
-        Path to the YAML configuration file.
+    config_path : str, PathLike or text stream
+        Path to the YAML configuration file, or an open stream of it.
     key : str
         Section name within the YAML file to parse.
 
@@ -392,9 +568,12 @@ def parse_yaml(config_path: pathlib.Path, key: str) -> dict:
             "Install it with: pip install PyYAML"
         )
 
-    expanded = config_path.expanduser()
-    with open(expanded, "r") as f:
-        data = yaml.safe_load(f)
+    import yaml  # type: ignore[import-untyped]
+
+    # libyaml bindings are much faster than the pure Python loader
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    content, source = _read_source(config_path)
+    data = yaml.load(content, Loader=loader)
 
     if not isinstance(data, dict):
         raise ValueError(
@@ -404,12 +583,10 @@ def parse_yaml(config_path: pathlib.Path, key: str) -> dict:
 
     if key not in data:
         established_keys = list(data.keys())
-        with open(expanded, "rt") as file:
-            content = file.read()
         raise KeyError(
             f"Could not find section '{key}', "
             f"only found [{', '.join(established_keys)}]."
-            f"Config File: {config_path}\n"
+            f"Config File: {source}\n"
             "---POTENTIALLY PRINTED SECRETS---\n"
             "Please review before copy-paste!\n"
             f"{content}"
@@ -420,14 +597,14 @@ def parse_yaml(config_path: pathlib.Path, key: str) -> dict:
 
 
 @register(".toml")
-def parse_toml(config_path: pathlib.Path, key: str) -> dict:
+def parse_toml(config_path: SOURCE, key: str) -> dict:
     """
     Parse a TOML configuration file.
 
     Parameters
     ----------
-    config_path : pathlib.Path
-        Path to the TOML configuration file.
+    config_path : str, PathLike or text stream
+        Path to the TOML configuration file, or an open stream of it.
     key : str
         Section name within the TOML file to parse.
 
@@ -458,18 +635,84 @@ def parse_toml(config_path: pathlib.Path, key: str) -> dict:
             "For Python < 3.11, install tomli with: pip install tomli"
         )
 
-    expanded = config_path.expanduser()
-    with open(expanded, "rb") as f:
-        data = tomllib.load(f)
+    try:
+        # Python 3.11+ has tomllib in standard library
+        import tomllib
+    except ImportError:
+        # For older Python versions, try tomli
+        import tomli as tomllib  # type: ignore[import-not-found,no-redef]
+
+    content, source = _read_source(config_path)
+    data = tomllib.loads(content)
+
+    if key not in data:
+        established_keys = list(data.keys())
+        raise KeyError(
+            f"Could not find section '{key}', "
+            f"only found [{', '.join(established_keys)}]."
+            f"Config File: {source}\n"
+            "---POTENTIALLY PRINTED SECRETS---\n"
+            "Please review before copy-paste!\n"
+            f"{content}"
+            "---END CONFIG CONTENT---"
+        )
+
+    return data[key]
+
+
+@register(".json")
+def parse_json(config_path: SOURCE, key: str) -> dict:
+    """
+    Parse a JSON configuration file.
+
+    JSON decoding is backed by a C extension in CPython, making this the
+    fastest of the built-in parsers for large configuration files.
+
+    Parameters
+    ----------
+    config_path : str, PathLike or text stream
+        Path to the JSON configuration file, or an open stream of it.
+    key : str
+        Name of the top-level object within the JSON file to parse.
+
+    Returns
+    -------
+    dict
+        Dictionary containing the section's key-value pairs.
+
+    Raises
+    ------
+    ValueError
+        If the top level of the file is not a JSON object.
+    KeyError
+        If the specified section is not found in the configuration file.
+        The error message includes available sections and file contents
+        for debugging (be careful with sensitive data).
+
+    Examples
+    --------
+    >>> # Parse the 'database' object from config.json
+    >>> config = parse_json(Path("config.json"), "database")
+    >>> host = config["host"]
+    >>> port = config["port"]
+    """
+    import json
+
+    content, source = _read_source(config_path)
+    data = json.loads(content)
+
+    if not isinstance(data, dict):
+        raise ValueError(
+            f"JSON file must contain an object at top level, "
+            f"got {type(data).__name__}"
+        )
 
     if key not in data:
         established_keys = list(data.keys())
-        with open(expanded, "rt") as file:
-            content = file.read()
         raise KeyError(
             f"Could not find section '{key}', "
             f"only found [{', '.join(established_keys)}]."
-            f"Config File: {config_path}\n"
+            f"Config File: {source}\n"
             "---POTENTIALLY PRINTED SECRETS---\n"
             "Please review before copy-paste!\n"
             f"{content}"
@@ -499,7 +742,7 @@ class Interpreter:
 
     name: typing.Optional[str] = None
 
-    def load(self, **context: typing.Any) -> dict:
+    def load(self, **context: typing.Any) -> typing.Mapping[str, typing.Any]:
         """
         Load configuration from this source.
 
@@ -515,7 +758,7 @@ class Interpreter:
         """
         return self.interpret(context)
 
-    def interpret(self, context: dict) -> dict:
+    def interpret(self, context: dict) -> typing.Mapping[str, typing.Any]:
         """
         Extract configuration from the source.
 
@@ -617,26 +860,40 @@ class Env(Interpreter):
     """
     Interpreter for environment variables.
 
-    Loads all environment variables as configuration values.
+    Loads environment variables as configuration values. When the context
+    names the keys of the schema being resolved, only those variables are
+    read.
     """
 
     name = "ENV"
 
-    def interpret(self, context: dict) -> dict:
+    def interpret(self, context: dict) -> typing.Mapping[str, typing.Any]:
         """
-        Load all environment variables.
+        Load environment variables.
 
         Parameters
         ----------
         context : dict
-            Not used by this interpreter.
+            May contain:
+            - schema_keys: Names to look up. If absent, a snapshot of the
+              whole environment is returned.
 
         Returns
         -------
-        dict
-            All environment variables as key-value pairs.
+        Mapping
+            Environment variables as key-value pairs.
         """
-        return dict(os.environ)
+        keys = context.get("schema_keys")
+        if keys is None:
+            return dict(os.environ)
+
+        environ = os.environ
+        values = {}
+        for key in keys:
+            value = environ.get(key)
+            if value is not None:
+                values[key] = value
+        return values
 
 
 class Cli(Interpreter):
@@ -662,7 +919,9 @@ class Cli(Interpreter):
         Parameters
         ----------
         context : dict
-            Not used by this interpreter.
+            May contain:
+            - schema_keys: Names to collect. Arguments for any other name
+              are skipped along with their values.
 
         Returns
         -------
@@ -672,30 +931,42 @@ class Cli(Interpreter):
             - Multiple values for same key become lists
             - Flags without values are None
         """
-        args = sys.argv
-        nargs = len(args)
-        cursor = 1
+        keys = context.get("schema_keys")
         accumulator = {}  # type: dict[str, typing.Union[str, list[str], None]]
-        while cursor < nargs:
-            arg = args[cursor]
-            if arg.startswith("--"):
-                param_name = arg[2:]
+        for param_name, values in _scan_argv(tuple(sys.argv)).items():
+            if keys is not None and param_name not in keys:
+                continue
+            if not values:
                 accumulator[param_name] = None
-
-                cursor += 1
-                while cursor < nargs and not args[cursor].startswith("--"):
-                    arg = args[cursor]
-                    current_val = accumulator[param_name]
-                    if isinstance(current_val, str):
-                        accumulator[param_name] = [current_val, arg]
-                    elif isinstance(current_val, list):
-                        current_val.append(arg)
-                    elif current_val is None:
-                        accumulator[param_name] = arg
-                    cursor += 1
+            elif len(values) == 1:
+                accumulator[param_name] = values[0]
+            else:
+                accumulator[param_name] = list(values)
         return accumulator
 
 
+@functools.lru_cache(maxsize=1)
+def _scan_argv(
+    args: typing.Tuple[str, ...],
+) -> typing.Dict[str, typing.Tuple[str, ...]]:
+    """
+    Group the values following each ``--name`` flag in ``args``.
+
+    Memoized on the argument tuple, so the scan runs once per process
+    unless ``sys.argv`` changes. Callers must not mutate the result.
+    """
+    groups: typing.Dict[str, typing.List[str]] = {}
+    # Positional arguments before the first flag are not configuration
+    values = None
+    for arg in args[1:]:
+        if arg.startswith("--"):
+            # A repeated flag starts over, the last occurrence wins
+            values = groups[arg[2:]] = []
+        elif values is not None:
+            values.append(arg)
+    return {name: tuple(group) for name, group in groups.items()}
+
+
 class Cfg(Interpreter):
     """
     Interpreter for configuration files.
@@ -706,7 +977,7 @@ class Cfg(Interpreter):
 
     name = "CFG"
 
-    def interpret(self, context: dict) -> dict:
+    def interpret(self, context: dict) -> typing.Mapping[str, typing.Any]:
         """
         Load configuration from file.
 
@@ -719,12 +990,11 @@ class Cfg(Interpreter):
 
         Returns
         -------
-        dict
+        Mapping
             Parsed configuration or empty dict if no config_path provided.
         """
-        try:
-            config_path = context["config_path"]
-        except KeyError:
+        config_path = context.get("config_path")
+        if config_path is None:
             return {}
 
         result = autoparse_config(
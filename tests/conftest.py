@@ -0,0 +1,37 @@
+import itertools
+import os
+
+import pytest
+from hypothesis import settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+# CI restores .hypothesis/ between runs so previously found failures are
+# replayed first.
+settings.register_profile(
+    "ci",
+    database=DirectoryBasedExampleDatabase(".hypothesis/examples"),
+)
+# Opt-in for local iteration; CI and the default run keep the full budget.
+settings.register_profile("quick", max_examples=25)
+# Without an explicit choice, leave profile selection to Hypothesis
+if "HYPOTHESIS_PROFILE" in os.environ:
+    settings.load_profile(os.environ["HYPOTHESIS_PROFILE"])
+
+
+@pytest.fixture(scope="module")
+def config_paths(tmp_path_factory):
+    """
+    Hand out fresh file paths inside one directory per test module.
+
+    Hypothesis runs a test body many times, so sharing the directory
+    avoids creating and removing one per example. Paths are never reused,
+    so each example writes a new file that is easy to tell apart in
+    Hypothesis notes.
+    """
+    folder = tmp_path_factory.mktemp("configs")
+    counter = itertools.count()
+
+    def _next(name="config.ini"):
+        return folder / f"{next(counter)}-{name}"
+
+    return _next
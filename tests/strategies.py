@@ -1,9 +1,11 @@
 import configparser
+from functools import lru_cache
+from itertools import permutations
 
-from hypothesis import note
+from hypothesis import assume, note
 from hypothesis import strategies as st
 
-from configurables import parse
+from configurables import configurable, param, parse
 
 RAW_TYPES = (str, int, float)
 
@@ -14,24 +16,96 @@ CONFIG_PARSE_ALPHABET = st.characters(
     blacklist_categories=["C", "Z"],
 )
 
+# Built once so every draw reuses the same strategy objects
+CONFIG_TEXT = st.text(min_size=1, alphabet=CONFIG_PARSE_ALPHABET)
+CONFIG_KEYS = CONFIG_TEXT.map(str.lower)
+CONFIG_VALUES = st.one_of(CONFIG_TEXT, st.integers(), st.floats())
+# A small shared pool makes keys collide across sources, which is where
+# resolution order matters; arbitrary keys are still mixed in.
+OVERLAPPING_KEYS = st.one_of(
+    st.sampled_from(["alpha", "beta", "gamma", "delta"]), CONFIG_KEYS
+)
+
+# Every non-empty ordering of the builtin interpreters
+RESOLUTION_ORDERINGS = [
+    ordering
+    for size in range(1, 4)
+    for ordering in permutations((parse.ENV, parse.CLI, parse.CFG), size)
+]
+
+
+def _ini_section(header, configuration):
+    # Matches ConfigParser.write output; CONFIG_PARSE_ALPHABET excludes
+    # every character that would need escaping or continuation lines.
+    lines = [f"[{header}]\n"]
+    lines.extend(f"{key} = {value}\n" for key, value in configuration.items())
+    lines.append("\n")
+    return "".join(lines)
+
 
 def write_ini_configuration(fout, header, configuration):
-    config = configparser.ConfigParser()
-    config[header] = configuration
-    config.write(fout)
+    fout.write(_ini_section(header, configuration))
     fout.seek(0)
     note(fout.read())
 
 
 def write_multi_ini_configuration(fout, configuration):
-    config = configparser.ConfigParser()
-    for header, subconfiguration in configuration.items():
-        config[header] = subconfiguration
-    config.write(fout)
+    fout.write(
+        "".join(
+            _ini_section(header, subconfiguration)
+            for header, subconfiguration in configuration.items()
+        )
+    )
     fout.seek(0)
     note(fout.read())
 
 
+# Returns the keyword arguments a configurable resolved; the builtin
+# avoids a Python frame per call.
+reflector = dict
+
+
+@lru_cache(maxsize=512)
+def _build_param_configurable(header, signature):
+    f = reflector
+    for key, _type in signature:
+        if _type is str:
+            f = param(key)(f)
+        else:
+            f = param(key, type=_type)(f)
+    return configurable(header)(f)
+
+
+def build_param_configurable(header, configuration):
+    """
+    Return a configurable reflecting a required ``param`` for each key.
+
+    Built factories are shared between examples with the same header and
+    ``(key, type)`` signature, which Hypothesis repeats while shrinking.
+    """
+    signature = tuple(
+        sorted(
+            ((key, type(value)) for key, value in configuration.items()),
+            key=lambda item: item[0],
+        )
+    )
+    return _build_param_configurable(header, signature)
+
+
+def assert_equivalent(result, reference):
+    """
+    Assert each value in ``result`` equals its ``reference`` counterpart.
+
+    NaN never equals itself, so a NaN only has to meet another NaN.
+    """
+    for key, value in result.items():
+        ref = reference[key]
+        if value != value:
+            assert ref != ref, key
+        else:
+            assert value == ref, key
+
+
 def write_env_configuration(monkeypatch, configuration):
     for key, value in configuration.items():
         monkeypatch.setenv(key, str(value))
@@ -40,6 +114,8 @@ def write_env_configuration(monkeypatch, configuration):
 def write_cli_configuration(monkeypatch, configuration):
     argv = ["fakecmd"]
     for key, value in configuration.items():
+        # Values beginning with "--" are indistinguishable from flags
+        assume(not str(value).startswith("--"))
         argv.append(f"--{key.replace(' ', '-')}")
         argv.append(str(value))
 
@@ -47,20 +123,16 @@ def write_cli_configuration(monkeypatch, configuration):
 
 
 def configurations():
-    return st.dictionaries(
-        st.text(min_size=1, alphabet=CONFIG_PARSE_ALPHABET).map(str.lower),
-        st.one_of(
-            st.text(alphabet=CONFIG_PARSE_ALPHABET, min_size=1),
-            st.integers(),
-            st.floats(),
-        ),
-        min_size=1,
-    )
+    return st.dictionaries(CONFIG_KEYS, CONFIG_VALUES, min_size=1)
+
+
+def overlapping_configurations():
+    return st.dictionaries(OVERLAPPING_KEYS, CONFIG_VALUES, min_size=1)
 
 
 def multi_configurations():
     return st.dictionaries(
-        st.text(min_size=1, alphabet=CONFIG_PARSE_ALPHABET),
+        CONFIG_TEXT.filter(lambda s: s != configparser.DEFAULTSECT),
         configurations(),
         min_size=1,
     )
@@ -68,11 +140,7 @@ def multi_configurations():
 
 @st.composite
 def config_strings(draw):
-    return draw(st.text(min_size=1, alphabet=CONFIG_PARSE_ALPHABET))
-
-
-@st.composite
-def resolutions(draw):
-    bag = st.sampled_from([parse.ENV, parse.CLI, parse.CFG])
-
-    return draw(st.lists(bag, min_size=1, unique=True))
+    # The DEFAULT section is reserved by configparser and never listed
+    header = draw(CONFIG_TEXT)
+    assume(header != configparser.DEFAULTSECT)
+    return header
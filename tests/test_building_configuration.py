@@ -1,18 +1,24 @@
+import io
 import pathlib
-from math import isnan
-from tempfile import NamedTemporaryFile, TemporaryDirectory
+from collections import OrderedDict
+from tempfile import TemporaryDirectory
 
+import pytest
 from hypothesis import given, note
 from hypothesis import strategies as st
 
-from configurables import configurable, configure, option, param
+from configurables import (
+    configurable,
+    configure_string,
+    option,
+    param,
+    params,
+)
 from configurables.core import ConfigurationBuilder
+from configurables.parse import autoparse_config
 
 from . import strategies as c_st
-
-
-def _reflector(**kwargs):
-    return kwargs
+from .strategies import reflector as _reflector
 
 
 def test_add_parameter_construction():
@@ -20,169 +26,111 @@ def test_add_parameter_construction():
     assert isinstance(f, ConfigurationBuilder)
 
 
+def test_add_parameters_in_bulk():
+    bulk = params({"name": str, "count": int})(_reflector)
+    stacked = param("count", type=int)(param("name", type=str)(_reflector))
+    assert isinstance(bulk, ConfigurationBuilder)
+    assert bulk.parameters == stacked.parameters
+
+
 @given(c_st.config_strings(), c_st.configurations())
-def test_building_configurable(header, configuration):
-    with TemporaryDirectory() as folder:
-        filepath = pathlib.Path(folder) / pathlib.Path("config.ini")
-        note(filepath)
-        with open(filepath, "w+") as fout:
-            c_st.write_ini_configuration(fout, header, configuration)
-
-        f = _reflector
-        for key, value in configuration.items():
-            if isinstance(value, str):
-                f = param(key)(f)
-            else:
-                f = param(key, type=type(value))(f)
-        f = configurable(header)(f)
-        result = f(filepath)
-        for key, value in result.items():
-            if isinstance(value, float) and isnan(value):
-                assert isnan(configuration[key])
-            else:
-                assert value == configuration[key]
+def test_building_configurable(config_paths, header, configuration):
+    filepath = config_paths()
+    note(filepath)
+    with open(filepath, "w+") as fout:
+        c_st.write_ini_configuration(fout, header, configuration)
+
+    f = c_st.build_param_configurable(header, configuration)
+    result = f(filepath)
+    c_st.assert_equivalent(result, configuration)
 
 
 @given(c_st.config_strings(), c_st.configurations(), st.data())
-def test_building_configurable_options(header, configuration, data):
+def test_building_configurable_options(
+    config_paths, header, configuration, data
+):
     missing_param = data.draw(st.sampled_from(sorted(configuration.keys())))
     ref_value = configuration.pop(missing_param)
-    with TemporaryDirectory() as folder:
-        filepath = pathlib.Path(folder) / pathlib.Path("config.ini")
-        note(str(filepath))
-        with open(filepath, "w+") as fout:
-            c_st.write_ini_configuration(fout, header, configuration)
-
-        f = _reflector
-        for key, value in configuration.items():
-            if isinstance(value, str):
-                f = option(key, default=value)(f)
-            else:
-                f = option(key, type=type(value), default=value)(f)
-        f = option(missing_param, type=type(ref_value), default=ref_value)(f)
-        f = configurable(header)(f)
-        result = f(filepath)
-
-        configuration[missing_param] = ref_value
-        for key, value in result.items():
-            if isinstance(value, float) and isnan(value):
-                assert isnan(configuration[key])
-            else:
-                assert value == configuration[key]
+    filepath = config_paths()
+    note(str(filepath))
+    with open(filepath, "w+") as fout:
+        c_st.write_ini_configuration(fout, header, configuration)
+
+    f = _reflector
+    for key, value in configuration.items():
+        if isinstance(value, str):
+            f = option(key, default=value)(f)
+        else:
+            f = option(key, type=type(value), default=value)(f)
+    f = option(missing_param, type=type(ref_value), default=ref_value)(f)
+    f = configurable(header)(f)
+    result = f(filepath)
+
+    configuration[missing_param] = ref_value
+    c_st.assert_equivalent(result, configuration)
 
 
 @given(c_st.config_strings(), c_st.configurations())
-def test_partial(header, configuration):
-    with TemporaryDirectory() as folder:
-        filepath = pathlib.Path(folder) / "config.ini"
-        note(str(filepath))
-        with open(filepath, "w+") as fout:
-            c_st.write_ini_configuration(fout, header, configuration)
-
-        f = _reflector
-        for key, value in configuration.items():
-            if isinstance(value, str):
-                f = param(key)(f)
-            else:
-                f = param(key, type=type(value))(f)
-        f = configurable(header)(f)
-        partial = f.partial(filepath)
-        result = partial()
-        for key, value in result.items():
-            if isinstance(value, float) and isnan(value):
-                assert isnan(configuration[key])
-            else:
-                assert value == configuration[key]
+def test_partial(config_paths, header, configuration):
+    filepath = config_paths()
+    note(str(filepath))
+    with open(filepath, "w+") as fout:
+        c_st.write_ini_configuration(fout, header, configuration)
+
+    f = c_st.build_param_configurable(header, configuration)
+    partial = f.partial(filepath)
+    result = partial()
+    c_st.assert_equivalent(result, configuration)
 
 
 @given(st.data(), c_st.config_strings(), c_st.configurations())
-def test_overrides(data, header, configuration):
-    override_keys = st.text(min_size=1).filter(
-        lambda s: s not in configuration
-    )
+def test_overrides(config_paths, data, header, configuration):
+    # "=" is excluded from configuration keys, so the prefix rules out
+    # collisions without rejection sampling
+    override_keys = st.text().map(lambda s: "=" + s)
     override_values = data.draw(
         st.dictionaries(
             override_keys,
             st.one_of(st.none(), st.integers(), st.floats(), st.text()),
         )
     )
-    with TemporaryDirectory() as folder:
-        filepath = pathlib.Path(folder) / pathlib.Path("config.ini")
-        with open(filepath, "w+") as fout:
-            c_st.write_ini_configuration(fout, header, configuration)
-
-        f = _reflector
-        for key, value in configuration.items():
-            if isinstance(value, str):
-                f = param(key)(f)
-            else:
-                f = param(key, type=type(value))(f)
-        f = configurable(header)(f)
-        result = f(filepath, **override_values)
-        note(str(result))
-        note(str(configuration))
-        note(str(override_values))
-        for key, value in result.items():
-            note(key)
-            try:
-                ref = override_values[key]
-            except KeyError:
-                ref = configuration[key]
-            if isinstance(value, float) and isnan(value):
-                assert isnan(ref)
-            else:
-                assert value == ref
+    filepath = config_paths()
+    with open(filepath, "w+") as fout:
+        c_st.write_ini_configuration(fout, header, configuration)
+
+    f = c_st.build_param_configurable(header, configuration)
+    result = f(filepath, **override_values)
+    note(str(result))
+    note(str(configuration))
+    note(str(override_values))
+    c_st.assert_equivalent(result, {**configuration, **override_values})
 
 
 @given(c_st.multi_configurations(), st.data())
-def test_group_override(configuration, data):
+def test_group_override(config_paths, configuration, data):
     target_header = data.draw(st.sampled_from(sorted(configuration.keys())))
     other_header = data.draw(st.sampled_from(sorted(configuration.keys())))
     reference_configuration = configuration[target_header]
-    with TemporaryDirectory() as folder:
-        filepath = pathlib.Path(folder) / "config.ini"
-        with open(filepath, "w+") as fout:
-            c_st.write_multi_ini_configuration(fout, configuration)
-        f = _reflector
-        for k, v in reference_configuration.items():
-            if isinstance(v, str):
-                f = param(k)(f)
-            else:
-                f = param(k, type=type(v))(f)
-        f = configurable(other_header)(f)
-        result = f(filepath, _section=target_header)
-        for k, v in result.items():
-            ref_value = reference_configuration[k]
-            if isinstance(ref_value, float) and isnan(ref_value):
-                assert isnan(v)
-            else:
-                assert v == ref_value
+    filepath = config_paths()
+    with open(filepath, "w+") as fout:
+        c_st.write_multi_ini_configuration(fout, configuration)
+    f = c_st.build_param_configurable(other_header, reference_configuration)
+    result = f(filepath, _section=target_header)
+    c_st.assert_equivalent(result, reference_configuration)
 
 
 @given(st.data(), c_st.config_strings(), c_st.configurations())
 def test_pass_through(data, header, configuration):
-    f = _reflector
     complete_override = {}
     for key in configuration.keys():
         complete_override[key] = data.draw(
             st.one_of(st.none(), st.integers(), st.floats(), st.text())
         )
 
-    for key, value in configuration.items():
-        if isinstance(value, str):
-            f = param(key)(f)
-        else:
-            f = param(key, type=type(value))(f)
-    f = configurable(header)(f)
+    f = c_st.build_param_configurable(header, configuration)
 
     result = f(**complete_override)
-    for key, value in result.items():
-        ref_value = complete_override[key]
-
-        if isinstance(value, float) and isnan(value):
-            assert isnan(ref_value)
-        else:
-            assert value == ref_value
+    c_st.assert_equivalent(result, complete_override)
 
 
 @given(c_st.multi_configurations(), st.data())
@@ -190,15 +138,109 @@ def test_configuration_override(configuration, data):
     target_header = data.draw(st.sampled_from(sorted(configuration.keys())))
     reference_configuration = configuration[target_header]
 
-    with NamedTemporaryFile("w+t") as tmpfile:
-        c_st.write_multi_ini_configuration(tmpfile, configuration)
-        result = configure(
-            _reflector,
-            tmpfile.name,
-            config_group=target_header,
-            extension_override=".ini",
-        )
+    stream = io.StringIO()
+    c_st.write_multi_ini_configuration(stream, configuration)
+    result = configure_string(
+        _reflector, stream.getvalue(), config_group=target_header
+    )
     assert set(result.keys()) == set(reference_configuration.keys())
 
     for k, v in result.items():
         assert v == str(reference_configuration[k])
+
+
+def test_custom_cast_memoized():
+    calls = []
+
+    def upper(value):
+        calls.append(value)
+        return value.upper()
+
+    def listed(value):
+        return value.split(",")
+
+    f = param("name", type=upper)(_reflector)
+    f = param("values", type=listed)(f)
+    f = configurable("Section", cache_casts=True)(f)
+    with TemporaryDirectory() as folder:
+        filepath = pathlib.Path(folder) / "config.ini"
+        filepath.write_text("[Section]\nname = value\nvalues = a,b\n")
+        first = f(filepath)
+        second = f(filepath)
+
+    assert first == second == {"name": "VALUE", "values": ["a", "b"]}
+    assert calls == ["value"]
+    # Mutable results are rebuilt rather than shared between calls
+    assert first["values"] is not second["values"]
+
+
+def test_custom_cast_cache_tolerates_concurrent_eviction():
+    class EvictedCache(OrderedDict):
+        # Mimics another thread evicting the entry after it was read
+        def move_to_end(self, key, last=True):
+            raise KeyError(key)
+
+    f = param("name", type=str.upper)(_reflector)
+    f = configurable("Section", cache_casts=True)(f)
+    f._cast_cache = EvictedCache()
+    with TemporaryDirectory() as folder:
+        filepath = pathlib.Path(folder) / "config.ini"
+        filepath.write_text("[Section]\nname = value\n")
+        assert f(filepath) == {"name": "VALUE"}
+        assert f(filepath) == {"name": "VALUE"}
+
+
+def test_custom_cast_not_memoized_by_default():
+    calls = []
+
+    def upper(value):
+        calls.append(value)
+        return value.upper()
+
+    f = configurable("Section")(param("name", type=upper)(_reflector))
+    with TemporaryDirectory() as folder:
+        filepath = pathlib.Path(folder) / "config.ini"
+        filepath.write_text("[Section]\nname = value\n")
+        assert f(filepath) == f(filepath) == {"name": "VALUE"}
+
+    assert calls == ["value", "value"]
+
+
+def test_overrides_skip_sources():
+    f = param("name")(_reflector)
+    f = option("count", type=int, default=1)(f)
+    f = configurable("Section")(f)
+    with TemporaryDirectory() as folder:
+        # The file is never read since every key is overridden
+        filepath = pathlib.Path(folder) / "missing.ini"
+        assert f(filepath, name="a", count=2) == {"name": "a", "count": 2}
+
+
+def test_parse_accepts_section_keyword():
+    f = configurable("Section")(param("name")(_reflector))
+    assert f.parse(section="Section", name="a") == {"name": "a"}
+
+
+def test_overrides_skip_conversion():
+    f = param("count", type=int)(_reflector)
+    f = configurable("Section")(f)
+    with TemporaryDirectory() as folder:
+        filepath = pathlib.Path(folder) / "config.ini"
+        filepath.write_text("[Section]\ncount = not a number\n")
+        # The unparseable file value is never converted
+        assert f(filepath, count=3) == {"count": 3}
+        with pytest.raises(ValueError):
+            f(filepath)
+
+
+def test_call_and_partial_share_parse():
+    f = param("count", type=int)(_reflector)
+    f = configurable("Section")(f)
+    with TemporaryDirectory() as folder:
+        filepath = pathlib.Path(folder) / "config.ini"
+        filepath.write_text("[Section]\ncount = 3\n")
+        assert f(filepath) == {"count": 3}
+        misses = autoparse_config.cache_info().misses
+        assert f.partial(filepath)() == {"count": 3}
+        # The file parsed by the call is reused by the partial
+        assert autoparse_config.cache_info().misses == misses
@@ -1,5 +1,4 @@
 import pathlib
-from math import isnan
 from tempfile import TemporaryDirectory
 
 from hypothesis import given, note
@@ -7,35 +6,37 @@ from hypothesis import given, note
 from configurables import configurable, param
 
 from . import strategies as c_st
+from .strategies import reflector as _reflector
 
 
-def _reflector(**kwargs):
-    return kwargs
+@given(c_st.config_strings(), c_st.configurations())
+def test_emission_equilvancy(config_paths, header, configuration):
+    filepath = config_paths()
+    emit_path = config_paths("emitted.ini")
+    with open(filepath, "w+") as fout:
+        c_st.write_ini_configuration(fout, header, configuration)
 
+    f = c_st.build_param_configurable(header, configuration)
 
-@given(c_st.config_strings(), c_st.configurations())
-def test_emission_equilvancy(header, configuration):
+    test_path = f.emit(emit_path, _filepath=filepath)
+
+    result = f(test_path)
+    note(open(filepath).read())
+    note(open(test_path).read())
+    c_st.assert_equivalent(result, configuration)
+
+
+def test_emission_string_path():
+    f = configurable("Section")(param("key")(_reflector))
+    with TemporaryDirectory() as folder:
+        emit_path = str(pathlib.Path(folder) / "emitted.ini")
+        test_path = f.emit(emit_path, key="value")
+        assert f(test_path) == {"key": "value"}
+
+
+def test_emission_registers_every_extension():
+    f = configurable("Section")(param("key")(_reflector))
     with TemporaryDirectory() as folder:
-        filepath = pathlib.Path(folder) / "config.ini"
-        emit_path = pathlib.Path(folder) / "emitted.ini"
-        with open(filepath, "w+") as fout:
-            c_st.write_ini_configuration(fout, header, configuration)
-
-        f = _reflector
-        for key, value in configuration.items():
-            if isinstance(value, str):
-                f = param(key)(f)
-            else:
-                f = param(key, type=type(value))(f)
-        f = configurable(header)(f)
-
-        test_path = f.emit(emit_path, _filepath=filepath)
-
-        result = f(test_path)
-        note(open(filepath).read())
-        note(open(test_path).read())
-        for key, value in result.items():
-            if isinstance(value, float) and isnan(value):
-                assert isnan(configuration[key])
-            else:
-                assert value == configuration[key]
+        emit_path = pathlib.Path(folder) / "emitted.conf"
+        test_path = f.emit(emit_path, key="value")
+        assert f(test_path) == {"key": "value"}
@@ -1,37 +1,35 @@
 #!/usr/bin/env python
 
 """Tests for `configurables` package."""
+import io
+import json
+import os
 import pathlib
-from tempfile import NamedTemporaryFile, TemporaryDirectory
+from tempfile import TemporaryDirectory
 
+import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from configurables import configure
+from configurables import configure, configure_string
 from configurables.configurable import configurable, param
+from configurables.parse import PARSING_REGISTRY, autoparse_config
 
 from . import strategies as c_st
-
-
-def _uno_reverse(**kwargs):
-    return kwargs
+from .strategies import reflector as _uno_reverse
 
 
 @given(c_st.config_strings(), c_st.configurations())
 def test_loading_ini_override(header, configuration):
-    with NamedTemporaryFile("w+t") as tmpfile:
-        c_st.write_ini_configuration(tmpfile, header, configuration)
-        tmpfile.seek(0)
-        result = configure(
-            _uno_reverse,
-            tmpfile.name,
-            config_group=header,
-            extension_override=".ini",
-        )
-        assert set(result.keys()) == set(configuration.keys())
+    stream = io.StringIO()
+    c_st.write_ini_configuration(stream, header, configuration)
+    result = configure_string(
+        _uno_reverse, stream.getvalue(), config_group=header
+    )
+    assert set(result.keys()) == set(configuration.keys())
 
-        for key, value in result.items():
-            assert value == str(configuration[key])
+    for key, value in result.items():
+        assert value == str(configuration[key])
 
 
 @given(c_st.config_strings(), c_st.configurations())
@@ -59,3 +57,114 @@ def test_repr(configuration, data):
     f = configurable("whatever")(f)
 
     assert repr(f) == repr(_uno_reverse)
+
+
+def test_loading_ini_cache_invalidation():
+    with TemporaryDirectory() as folder:
+        tmpfile = pathlib.Path(folder) / "config.ini"
+        tmpfile.write_text("[Section]\nkey = first\n")
+        first = configure(_uno_reverse, tmpfile, config_group="Section")
+        assert first == {"key": "first"}
+        assert configure(_uno_reverse, tmpfile, "Section") == first
+
+        # Same size, so only the modification time distinguishes the files
+        tmpfile.write_text("[Section]\nkey = other\n")
+        stat = tmpfile.stat()
+        os.utime(tmpfile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        second = configure(_uno_reverse, tmpfile, config_group="Section")
+        assert second == {"key": "other"}
+
+
+@given(c_st.config_strings(), c_st.configurations())
+def test_loading_json(header, configuration):
+    with TemporaryDirectory() as folder:
+        tmpfile = pathlib.Path(folder) / "config.json"
+        tmpfile.write_text(json.dumps({header: configuration}))
+        result = configure(_uno_reverse, tmpfile, config_group=header)
+        assert set(result.keys()) == set(configuration.keys())
+
+        c_st.assert_equivalent(result, configuration)
+
+
+def test_loading_yaml():
+    pytest.importorskip("yaml")
+    with TemporaryDirectory() as folder:
+        tmpfile = pathlib.Path(folder) / "config.yaml"
+        tmpfile.write_text("Section:\n  name: value\n  count: 3\n")
+        result = configure(_uno_reverse, tmpfile, config_group="Section")
+        assert result == {"name": "value", "count": 3}
+
+
+def test_loading_cache_copies_nested_values():
+    def append(values):
+        values.append(99)
+        return values
+
+    with TemporaryDirectory() as folder:
+        tmpfile = pathlib.Path(folder) / "config.json"
+        tmpfile.write_text(json.dumps({"Section": {"values": [1, 2]}}))
+        assert configure(append, tmpfile, "Section") == [1, 2, 99]
+        assert configure(append, tmpfile, "Section") == [1, 2, 99]
+
+        loaded = autoparse_config(tmpfile, "Section")
+        loaded["values"] = []
+        assert autoparse_config(tmpfile, "Section") == {"values": [1, 2]}
+
+
+def test_loading_cache_follows_working_directory(tmp_path, monkeypatch):
+    for name, value in (("first", "a"), ("second", "b")):
+        folder = tmp_path / name
+        folder.mkdir()
+        tmpfile = folder / "c.ini"
+        tmpfile.write_text(f"[Section]\nkey = {value}\n")
+        os.utime(tmpfile, ns=(0, 0))
+
+    monkeypatch.chdir(tmp_path / "first")
+    assert configure(_uno_reverse, "c.ini", "Section") == {"key": "a"}
+    monkeypatch.chdir(tmp_path / "second")
+    assert configure(_uno_reverse, "c.ini", "Section") == {"key": "b"}
+
+
+def test_loading_cache_clear():
+    with TemporaryDirectory() as folder:
+        tmpfile = pathlib.Path(folder) / "config.ini"
+        tmpfile.write_text("[Section]\nkey = value\n")
+        configure(_uno_reverse, tmpfile, config_group="Section")
+        autoparse_config.cache_clear()
+        assert autoparse_config.cache_info().currsize == 0
+
+
+def test_loading_cache_follows_registry(monkeypatch):
+    monkeypatch.setitem(PARSING_REGISTRY, ".first", lambda path, key: {})
+    with TemporaryDirectory() as folder:
+        tmpfile = pathlib.Path(folder) / "config.first"
+        tmpfile.write_text("unused")
+        assert configure(_uno_reverse, tmpfile, "Section") == {}
+
+        def parser(path, key):
+            return {"key": key}
+
+        # Re-registering the extension must not serve the stale parse
+        monkeypatch.setitem(PARSING_REGISTRY, ".first", parser)
+        result = configure(_uno_reverse, tmpfile, "Section")
+        assert result == {"key": "Section"}
+
+
+def test_loading_path_extension_override(tmp_path):
+    # The suffix alone would route this file to the INI parser
+    tmpfile = tmp_path / "config.data"
+    tmpfile.write_text(json.dumps({"Section": {"key": 1}}))
+    result = configure(
+        _uno_reverse, tmpfile, "Section", extension_override=".json"
+    )
+    assert result == {"key": 1}
+
+
+def test_loading_stream_extension():
+    stream = io.StringIO(json.dumps({"Section": {"key": 1}}))
+    result = configure(_uno_reverse, stream, "Section", ".json")
+    assert result == {"key": 1}
+
+    stream = io.StringIO("[Other]\nkey = 1\n")
+    with pytest.raises(KeyError, match="<stream>"):
+        configure(_uno_reverse, stream, "Section")
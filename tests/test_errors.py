@@ -8,10 +8,7 @@ from hypothesis import strategies as st
 from configurables import configurable, param, parse
 
 from . import strategies as c_st
-
-
-def _reflector(**kwargs):
-    return kwargs
+from .strategies import reflector as _reflector
 
 
 @given(c_st.multi_configurations(), st.data())
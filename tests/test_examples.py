@@ -1,6 +1,5 @@
 import pathlib
 from multiprocessing import cpu_count
-from tempfile import TemporaryDirectory
 
 from hypothesis import given
 from hypothesis import strategies as st
@@ -29,30 +28,28 @@ def run_pipeline(ra, dec, n_workers, output_path):
     )
 
 
-def test_login():
-    with TemporaryDirectory() as tmpdir:
-        configpath = pathlib.Path(tmpdir) / pathlib.Path("config.ini")
-        with open(configpath, "wt") as fout:
-            fout.write("[Credentials]\n")
-            fout.write("username=username\n")
-            fout.write("password=password\n")
-        username, password = login(configpath)
-        assert username == "username"
-        assert password == "password"
+def test_login(config_paths):
+    configpath = config_paths()
+    configpath.write_text(
+        "[Credentials]\n" "username=username\n" "password=password\n"
+    )
+    username, password = login(configpath)
+    assert username == "username"
+    assert password == "password"
 
 
 @given(st.floats(), st.floats(), st.integers())
-def test_run_pipeline_bare(ra, dec, n_workers):
-    with TemporaryDirectory() as tmpdir:
-        configpath = pathlib.Path(tmpdir) / pathlib.Path("config.ini")
-        with open(configpath, "wt") as fout:
-            fout.write("[PipelineSettings]\n")
-            fout.write(f"ra={ra}\n")
-            fout.write(f"dec={dec}\n")
-            fout.write(f"n_workers={n_workers}\n")
-            fout.write("output_path=./output\n")
-        string = run_pipeline(configpath)
-        point_str, worker_str, output = string.split("\n")
-        assert str(ra) in point_str
-        assert str(dec) in point_str
-        assert str(n_workers) in worker_str
+def test_run_pipeline_bare(config_paths, ra, dec, n_workers):
+    configpath = config_paths()
+    configpath.write_text(
+        "[PipelineSettings]\n"
+        f"ra={ra}\n"
+        f"dec={dec}\n"
+        f"n_workers={n_workers}\n"
+        "output_path=./output\n"
+    )
+    string = run_pipeline(configpath)
+    point_str, worker_str, output = string.split("\n")
+    assert str(ra) in point_str
+    assert str(dec) in point_str
+    assert str(n_workers) in worker_str
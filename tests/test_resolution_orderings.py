@@ -1,39 +1,59 @@
-import pathlib
-from functools import reduce
-from math import isnan
-from tempfile import TemporaryDirectory
+import operator
+import sys
+from functools import lru_cache, reduce
 
-from hypothesis import HealthCheck, given, note, settings
+import pytest
+from hypothesis import HealthCheck, Phase, given, note, settings
 from hypothesis import strategies as st
 
-from configurables import configurable, param
+from configurables import configurable, params, parse
 
 from . import strategies as c_st
+from .strategies import reflector as _reflector
 
 
-def _reflector(**kwargs):
-    return kwargs
+@lru_cache(maxsize=512)
+def _build_factory(header, combine, ordering, signature):
+    # Keyed on the interpreter singletons rather than the combined
+    # ResolutionDefinition, which hashes by identity.
+    func = params(dict(signature))(_reflector)
+    return configurable(header, order=reduce(combine, ordering))(func)
 
 
+def _ordering_id(ordering):
+    return "-".join(interpreter.name for interpreter in ordering)
+
+
+@pytest.mark.parametrize(
+    "combine, symbol, step",
+    [(operator.gt, ">", 1), (operator.lt, "<", -1)],
+    ids=["gt", "lt"],
+)
+@pytest.mark.parametrize(
+    "ordering", c_st.RESOLUTION_ORDERINGS, ids=_ordering_id
+)
 @settings(
     suppress_health_check=[HealthCheck.function_scoped_fixture],
-    max_examples=500,
+    max_examples=25,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink],
 )
-@given(c_st.resolutions(), c_st.config_strings(), st.data())
-def test_orderings(monkeypatch, ordering, header, data):
+@given(header=c_st.config_strings(), data=st.data())
+def test_orderings(
+    config_paths, monkeypatch, combine, symbol, step, ordering, header, data
+):
     configurations = data.draw(
         st.lists(
-            c_st.configurations(),
+            c_st.overlapping_configurations(),
             min_size=len(ordering),
             max_size=len(ordering),
         )
     )
-    with TemporaryDirectory() as folder, monkeypatch.context() as m:
-        filepath = pathlib.Path(folder) / "config.ini"
+    filepath = config_paths()
+    with monkeypatch.context() as m:
         reference = {}
-        types = {}
-        defined_keys = set()
-        for order, conf in zip(ordering, configurations):
+        # Sources are written lowest precedence first so later updates
+        # to the reference win, matching the resolved order
+        for order, conf in zip(ordering[::step], configurations):
             reference.update(conf)
             if order.name == "ENV":
                 c_st.write_env_configuration(m, conf)
@@ -42,84 +62,59 @@ def test_orderings(monkeypatch, ordering, header, data):
             elif order.name == "CFG":
                 with open(filepath, "w+") as fout:
                     c_st.write_ini_configuration(fout, header, conf)
-            defined_keys.update(conf.keys())
-            for key, value in conf.items():
-                types[key] = type(value)
-
-        order = reduce(lambda lhs, rhs: lhs > rhs, ordering)
 
-        func = _reflector
-        for key in defined_keys:
-            type_ = types[key]
-            func = param(key, type=type_)(func)
-        func = configurable(header, order=order)(func)
+        signature = tuple(
+            sorted((key, type(value)) for key, value in reference.items())
+        )
+        func = _build_factory(header, combine, tuple(ordering), signature)
 
         if any(order.name == "CFG" for order in ordering):
             result = func(filepath)
         else:
             result = func()
 
-        order_debug = [order.name for order in ordering]
-        note(f"Order: {' > '.join(order_debug)}")
+        order_debug = f" {symbol} ".join(order.name for order in ordering)
+        note(f"Order: {order_debug}")
         note(func)
-        for key, value in result.items():
-            ref = reference[key]
-            if isinstance(value, float) and isnan(value):
-                assert isnan(ref)
-            else:
-                assert value == ref
+        c_st.assert_equivalent(result, reference)
 
 
-@settings(
-    suppress_health_check=[HealthCheck.function_scoped_fixture],
-    max_examples=500,
-)
-@given(c_st.resolutions(), c_st.config_strings(), st.data())
-def test_orderings_lt(monkeypatch, ordering, header, data):
-    configurations = data.draw(
-        st.lists(
-            c_st.configurations(),
-            min_size=len(ordering),
-            max_size=len(ordering),
-        )
-    )
-    with TemporaryDirectory() as folder, monkeypatch.context() as m:
-        filepath = pathlib.Path(folder) / "config.ini"
-        reference = {}
-        types = {}
-        defined_keys = set()
-        for order, conf in zip(ordering[::-1], configurations):
-            reference.update(conf)
-            if order.name == "ENV":
-                c_st.write_env_configuration(m, conf)
-            elif order.name == "CLI":
-                c_st.write_cli_configuration(m, conf)
-            elif order.name == "CFG":
-                with open(filepath, "w+") as fout:
-                    c_st.write_ini_configuration(fout, header, conf)
-            defined_keys.update(conf.keys())
-            for key, value in conf.items():
-                types[key] = type(value)
+def test_env_reads_schema_keys_only(monkeypatch):
+    monkeypatch.setenv("configurables_wanted", "1")
+    monkeypatch.setenv("configurables_unwanted", "2")
+    context = {"schema_keys": frozenset({"configurables_wanted", "absent"})}
+    assert parse.ENV.interpret(context) == {"configurables_wanted": "1"}
+    assert "configurables_unwanted" in parse.ENV.interpret({})
 
-        order = reduce(lambda lhs, rhs: lhs < rhs, ordering)
 
-        func = _reflector
-        for key in defined_keys:
-            type_ = types[key]
-            func = param(key, type=type_)(func)
-        func = configurable(header, order=order)(func)
+def test_cli_reads_schema_keys_only(monkeypatch):
+    argv = ["prog", "input", "--wanted", "a", "b", "--unwanted", "c", "--flag"]
+    monkeypatch.setattr(sys, "argv", argv)
+    context = {"schema_keys": frozenset({"wanted", "flag"})}
+    assert parse.CLI.interpret(context) == {"wanted": ["a", "b"], "flag": None}
+    assert parse.CLI.interpret({})["unwanted"] == "c"
 
-        if any(order.name == "CFG" for order in ordering):
-            result = func(filepath)
-        else:
-            result = func()
 
-        order_debug = [order.name for order in ordering]
-        note(f"Order: {' < '.join(order_debug)}")
-        note(func)
-        for key, value in result.items():
-            ref = reference[key]
-            if isinstance(value, float) and isnan(value):
-                assert isnan(ref)
-            else:
-                assert value == ref
+def test_single_source_is_not_merged(monkeypatch):
+    monkeypatch.setenv("configurables_single", "1")
+    order = parse.ResolutionDefinition(parse.ENV)
+    loaded = order.load(schema_keys=frozenset({"configurables_single"}))
+    assert loaded == {"configurables_single": "1"}
+
+
+def test_env_without_schema_is_a_snapshot(monkeypatch):
+    monkeypatch.setenv("configurables_snapshot", "1")
+    loaded = parse.ResolutionDefinition(parse.ENV).load()
+    monkeypatch.setenv("configurables_snapshot", "2")
+    monkeypatch.setenv("configurables_added", "3")
+    assert loaded["configurables_snapshot"] == "1"
+    assert "configurables_added" not in loaded
+
+
+def test_cli_scan_follows_argv(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["prog", "--key", "a", "b"])
+    first = parse.CLI.interpret({})
+    first["key"].append("c")
+    assert parse.CLI.interpret({}) == {"key": ["a", "b"]}
+    monkeypatch.setattr(sys, "argv", ["prog", "--key", "d"])
+    assert parse.CLI.interpret({}) == {"key": "d"}
@@ -1,5 +1,4 @@
 """Test type preservation and hints."""
-import pathlib
 from typing import TYPE_CHECKING
 
 import configurables as conf
@@ -18,7 +17,7 @@ def process_data(name: str, count: int, debug: bool = False) -> str:
     return result
 
 
-def test_type_preservation():
+def test_type_preservation(config_paths):
     """Test that types are preserved through decoration."""
     # The decorated function should still be callable
     assert callable(process_data)
@@ -28,48 +27,36 @@ def test_type_preservation():
     
     # The factory should preserve the return type
     # When called with config, it returns the same type as the original function
-    with open("test_config.ini", "w") as f:
-        f.write("[TestSection]\n")
-        f.write("name=test\n")
-        f.write("count=5\n")
-    
-    try:
-        result = process_data("test_config.ini")
-        assert isinstance(result, str)
-        assert result == "Processing test 5 times"
-        
-        # Test with overrides
-        result2 = process_data("test_config.ini", debug=True)
-        assert isinstance(result2, str)
-        assert result2 == "Processing test 5 times (debug mode)"
-        
-        # Test direct call
-        result3 = process_data(name="direct", count=3, debug=False)
-        assert isinstance(result3, str)
-        assert result3 == "Processing direct 3 times"
-        
-    finally:
-        pathlib.Path("test_config.ini").unlink()
+    config_path = config_paths("test_config.ini")
+    config_path.write_text("[TestSection]\nname=test\ncount=5\n")
+
+    result = process_data(config_path)
+    assert isinstance(result, str)
+    assert result == "Processing test 5 times"
+
+    # Test with overrides
+    result2 = process_data(config_path, debug=True)
+    assert isinstance(result2, str)
+    assert result2 == "Processing test 5 times (debug mode)"
+
+    # Test direct call
+    result3 = process_data(name="direct", count=3, debug=False)
+    assert isinstance(result3, str)
+    assert result3 == "Processing direct 3 times"
 
 
-def test_partial_typing():
+def test_partial_typing(config_paths):
     """Test that partial functions preserve types."""
-    with open("test_config.ini", "w") as f:
-        f.write("[TestSection]\n")
-        f.write("name=partial\n")
-        f.write("count=10\n")
-    
-    try:
-        # Create a partial function
-        partial_func = process_data.partial("test_config.ini")
-        
-        # The partial should still return the correct type
-        result = partial_func()
-        assert isinstance(result, str)
-        assert result == "Processing partial 10 times"
-        
-    finally:
-        pathlib.Path("test_config.ini").unlink()
+    config_path = config_paths("test_config.ini")
+    config_path.write_text("[TestSection]\nname=partial\ncount=10\n")
+
+    # Create a partial function from a str path
+    partial_func = process_data.partial(str(config_path))
+
+    # The partial should still return the correct type
+    result = partial_func()
+    assert isinstance(result, str)
+    assert result == "Processing partial 10 times"
 
 
 if TYPE_CHECKING: